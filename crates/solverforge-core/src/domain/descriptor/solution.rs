@@ -122,11 +122,18 @@ impl SolutionDescriptor {
     }
 
     pub fn all_entity_refs(&self, solution: &dyn Any) -> Vec<(usize, EntityRef)> {
-        let mut refs = Vec::new();
+        let capacity = self
+            .entity_descriptors
+            .iter()
+            .filter_map(|desc| desc.entity_count(solution))
+            .sum();
+        let mut refs = Vec::with_capacity(capacity);
         for (desc_idx, desc) in self.entity_descriptors.iter().enumerate() {
-            for entity_ref in desc.entity_refs(solution) {
-                refs.push((desc_idx, entity_ref));
-            }
+            refs.extend(
+                desc.entity_refs(solution)
+                    .into_iter()
+                    .map(|entity_ref| (desc_idx, entity_ref)),
+            );
         }
         refs
     }
@@ -182,6 +182,33 @@ pub(crate) fn expand_derive(input: DeriveInput) -> Result<TokenStream, Error> {
     let collection_source_methods = generate_collection_source_methods(fields);
     let constraint_stream_extensions = generate_constraint_stream_extensions(fields, name);
 
+    let build_descriptor = quote! {{
+        let mut descriptor = ::solverforge::__internal::SolutionDescriptor::new(
+            #name_str,
+            ::std::any::TypeId::of::<Self>(),
+        )
+        .with_score_field(#score_field_str)
+        #(#entity_descriptors)*
+        #(#fact_descriptors)*;
+        <Self as ::solverforge::__internal::PlanningModelSupport>::attach_descriptor_hooks(
+            &mut descriptor,
+        );
+        <Self as ::solverforge::__internal::PlanningModelSupport>::validate_model(&descriptor);
+        descriptor
+    }};
+    // A static inside a generic impl is shared by every instantiation, so only
+    // non-generic solutions build and validate their descriptor once.
+    let descriptor_body = if generics.params.is_empty() {
+        quote! {
+            static DESCRIPTOR: ::std::sync::OnceLock<
+                ::solverforge::__internal::SolutionDescriptor,
+            > = ::std::sync::OnceLock::new();
+            DESCRIPTOR.get_or_init(|| #build_descriptor).clone()
+        }
+    } else {
+        build_descriptor
+    };
+
     let expanded = quote! {
         impl #impl_generics ::solverforge::__internal::PlanningSolution for #name #ty_generics #where_clause {
             type Score = #score_type;
@@ -192,20 +219,7 @@ pub(crate) fn expand_derive(input: DeriveInput) -> Result<TokenStream, Error> {
 
         impl #impl_generics #name #ty_generics #where_clause {
             pub fn descriptor() -> ::solverforge::__internal::SolutionDescriptor {
-                let mut descriptor = ::solverforge::__internal::SolutionDescriptor::new(
-                    #name_str,
-                    ::std::any::TypeId::of::<Self>(),
-                )
-                .with_score_field(#score_field_str)
-                #(#entity_descriptors)*
-                #(#fact_descriptors)*;
-                <Self as ::solverforge::__internal::PlanningModelSupport>::attach_descriptor_hooks(
-                    &mut descriptor,
-                );
-                <Self as ::solverforge::__internal::PlanningModelSupport>::validate_model(
-                    &descriptor,
-                );
-                descriptor
+                #descriptor_body
             }
 
             #[inline]
@@ -130,8 +130,10 @@ fn generate_scalar_candidate_count_helper(
             }
         }
 
-        fn __solverforge_scalar_candidate_count(solution: &#solution_name) -> usize {
-            let descriptor = Self::descriptor();
+        fn __solverforge_scalar_candidate_count(
+            solution: &#solution_name,
+            descriptor: &::solverforge::__internal::SolutionDescriptor,
+        ) -> usize {
             let __solverforge_scalar_provider_fields: &[&str] = &[
                 #(#provider_names),*
             ];
@@ -268,7 +268,6 @@ pub(super) fn generate_runtime_phase_support(
                 }
 
                 fn __solverforge_log_scale(solution: &Self) {
-                    let descriptor = Self::descriptor();
                     if Self::__solverforge_has_list_variable() {
                         ::solverforge::__internal::log_solve_start(
                             Self::__solverforge_total_list_entities(solution),
@@ -278,13 +277,14 @@ pub(super) fn generate_runtime_phase_support(
                             ::core::option::Option::None,
                         );
                     } else {
+                        let descriptor = Self::descriptor();
                         ::solverforge::__internal::log_solve_start(
                             descriptor
                                 .total_entity_count(solution as &dyn ::std::any::Any)
                                 .unwrap_or(0),
                             ::core::option::Option::None,
                             ::core::option::Option::Some(
-                                Self::__solverforge_scalar_candidate_count(solution),
+                                Self::__solverforge_scalar_candidate_count(solution, &descriptor),
                             ),
                         );
                     }
@@ -319,7 +319,7 @@ pub(super) fn generate_runtime_phase_support(
                         .unwrap_or(0),
                     ::core::option::Option::None,
                     ::core::option::Option::Some(
-                        Self::__solverforge_scalar_candidate_count(solution),
+                        Self::__solverforge_scalar_candidate_count(solution, &descriptor),
                     ),
                 );
             }
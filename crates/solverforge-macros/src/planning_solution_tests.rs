@@ -254,3 +254,38 @@ fn solution_descriptor_delegates_scalar_hook_attachment_to_model_manifest() {
     assert!(expanded.contains("attach_descriptor_hooks"));
     assert!(expanded.contains("validate_model"));
 }
+
+#[test]
+fn solution_descriptor_is_cached_only_for_non_generic_solutions() {
+    let plain = parse_quote! {
+        #[solverforge_constraints_path = "crate::constraints::create_constraints"]
+        struct Plan {
+            #[planning_entity_collection]
+            tasks: Vec<Task>,
+            #[planning_score]
+            score: Option<HardSoftScore>,
+        }
+    };
+    let generic = parse_quote! {
+        #[solverforge_constraints_path = "crate::constraints::create_constraints"]
+        struct Plan<T> {
+            #[planning_entity_collection]
+            tasks: Vec<Task<T>>,
+            #[planning_score]
+            score: Option<HardSoftScore>,
+        }
+    };
+
+    let plain = expand_derive(plain)
+        .expect("solution expansion should succeed")
+        .to_string();
+    let generic = expand_derive(generic)
+        .expect("generic solution expansion should succeed")
+        .to_string();
+
+    assert!(plain.contains("static DESCRIPTOR"));
+    assert!(plain.contains("OnceLock < :: solverforge :: __internal :: SolutionDescriptor , >"));
+    assert!(plain.contains("DESCRIPTOR . get_or_init"));
+    assert!(!generic.contains("static DESCRIPTOR"));
+    assert!(generic.contains("validate_model"));
+}
@@ -39,6 +39,15 @@ pub trait IncrementalConstraint<S, Sc: Score>: IncrementalConstraintSealed + Sen
     // Returns the number of matches for this constraint.
     fn match_count(&self, solution: &S) -> usize;
 
+    /* Returns the full score and match count together.
+
+    The default runs `evaluate` and `match_count` separately. Join-backed
+    constraints override it so score analysis enumerates matches only once.
+    */
+    fn evaluate_with_match_count(&self, solution: &S) -> (Sc, usize) {
+        (self.evaluate(solution), self.match_count(solution))
+    }
+
     /* Initializes internal state by inserting all entities.
 
     Must be called before using incremental methods (`on_insert`/`on_retract`).
@@ -235,10 +244,11 @@ where
     }
 
     fn evaluate_each<'a>(&'a self, solution: &S) -> Vec<ConstraintResult<'a, Sc>> {
+        let (score, match_count) = self.evaluate_with_match_count(solution);
         vec![ConstraintResult {
             name: self.name(),
-            score: self.evaluate(solution),
-            match_count: self.match_count(solution),
+            score,
+            match_count,
             is_hard: self.is_hard(),
         }]
     }
@@ -25,31 +25,18 @@ where
     Sc: Score,
 {
     fn evaluate(&self, solution: &S) -> Sc {
-        let entities_a = self.extractor_a.extract(solution);
-        let entities_b = self.extractor_b.extract(solution);
-        let b_by_key = self.b_index_for(solution, entities_b);
-        let mut total = Sc::zero();
-
-        for (a_idx, a) in entities_a.iter().enumerate() {
-            if !self.extractor_a.contains(solution, a) {
-                continue;
-            }
-            for &b_idx in self.matching_b_indices_in(&b_by_key, a) {
-                let b = &entities_b[b_idx];
-                if (self.filter)(solution, a, b, a_idx, b_idx) {
-                    total =
-                        total + self.compute_score(solution, entities_a, entities_b, a_idx, b_idx);
-                }
-            }
-        }
-
-        total
+        self.evaluate_with_match_count(solution).0
     }
 
     fn match_count(&self, solution: &S) -> usize {
+        self.evaluate_with_match_count(solution).1
+    }
+
+    fn evaluate_with_match_count(&self, solution: &S) -> (Sc, usize) {
         let entities_a = self.extractor_a.extract(solution);
         let entities_b = self.extractor_b.extract(solution);
         let b_by_key = self.b_index_for(solution, entities_b);
+        let mut total = Sc::zero();
         let mut count = 0;
 
         for (a_idx, a) in entities_a.iter().enumerate() {
@@ -59,12 +46,14 @@ where
             for &b_idx in self.matching_b_indices_in(&b_by_key, a) {
                 let b = &entities_b[b_idx];
                 if (self.filter)(solution, a, b, a_idx, b_idx) {
+                    total =
+                        total + self.compute_score(solution, entities_a, entities_b, a_idx, b_idx);
                     count += 1;
                 }
             }
         }
 
-        count
+        (total, count)
     }
 
     fn initialize(&mut self, solution: &S) -> Sc {
@@ -75,17 +64,17 @@ where
 
         self.build_indexes(solution, entities_a, entities_b);
 
+        let b_by_key = std::mem::take(&mut self.b_by_key);
         let mut total = Sc::zero();
-        for a_idx in 0..entities_a.len() {
-            if !self.extractor_a.contains(solution, &entities_a[a_idx]) {
+        for (a_idx, a) in entities_a.iter().enumerate() {
+            if !self.extractor_a.contains(solution, a) {
                 continue;
             }
-            let key = (self.key_a)(&entities_a[a_idx]);
-            let b_indices = self.b_by_key.get(&key).cloned().unwrap_or_default();
-            for b_idx in b_indices {
+            for &b_idx in self.matching_b_indices_in(&b_by_key, a) {
                 total = total + self.add_match(solution, entities_a, entities_b, a_idx, b_idx);
             }
         }
+        self.b_by_key = b_by_key;
 
         total
     }
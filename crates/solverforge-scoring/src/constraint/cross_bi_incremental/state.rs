@@ -46,12 +46,13 @@ where
     pub(super) b_source: ChangeSource,
     pub(super) matches: HashMap<(usize, usize), usize>,
     pub(super) match_rows: Vec<MatchRow<Sc>>,
-    pub(super) a_to_matches: HashMap<usize, Vec<usize>>,
-    pub(super) b_to_matches: HashMap<usize, Vec<usize>>,
+    // Per-entity columns, indexed directly by entity position.
+    pub(super) a_to_matches: Vec<Vec<usize>>,
+    pub(super) b_to_matches: Vec<Vec<usize>>,
     pub(super) a_by_key: HashMap<K, Vec<usize>>,
     pub(super) b_by_key: HashMap<K, Vec<usize>>,
-    pub(super) a_index_to_key: HashMap<usize, K>,
-    pub(super) b_index_to_key: HashMap<usize, K>,
+    pub(super) a_index_to_key: Vec<Option<K>>,
+    pub(super) b_index_to_key: Vec<Option<K>>,
     pub(super) _phantom: PhantomData<(fn() -> S, fn() -> A, fn() -> B)>,
 }
 
@@ -184,12 +185,12 @@ where
             b_source,
             matches: HashMap::new(),
             match_rows: Vec::new(),
-            a_to_matches: HashMap::new(),
-            b_to_matches: HashMap::new(),
+            a_to_matches: Vec::new(),
+            b_to_matches: Vec::new(),
             a_by_key: HashMap::new(),
             b_by_key: HashMap::new(),
-            a_index_to_key: HashMap::new(),
-            b_index_to_key: HashMap::new(),
+            a_index_to_key: Vec::new(),
+            b_index_to_key: Vec::new(),
             _phantom: PhantomData,
         }
     }
@@ -213,7 +214,7 @@ where
     }
 
     pub(super) fn b_index_for(&self, solution: &S, entities_b: &[B]) -> HashMap<K, Vec<usize>> {
-        let mut b_by_key: HashMap<K, Vec<usize>> = HashMap::new();
+        let mut b_by_key: HashMap<K, Vec<usize>> = HashMap::with_capacity(entities_b.len());
         for (b_idx, b) in entities_b.iter().enumerate() {
             if !self.extractor_b.contains(solution, b) {
                 continue;
@@ -229,12 +230,16 @@ where
         self.b_by_key.clear();
         self.a_index_to_key.clear();
         self.b_index_to_key.clear();
+        self.a_index_to_key.resize_with(entities_a.len(), || None);
+        self.b_index_to_key.resize_with(entities_b.len(), || None);
+        self.a_to_matches.resize_with(entities_a.len(), Vec::new);
+        self.b_to_matches.resize_with(entities_b.len(), Vec::new);
         for (a_idx, a) in entities_a.iter().enumerate() {
             if !self.extractor_a.contains(solution, a) {
                 continue;
             }
             let key = (self.key_a)(a);
-            self.a_index_to_key.insert(a_idx, key.clone());
+            self.a_index_to_key[a_idx] = Some(key.clone());
             self.a_by_key.entry(key).or_default().push(a_idx);
         }
         for (b_idx, b) in entities_b.iter().enumerate() {
@@ -242,7 +247,7 @@ where
                 continue;
             }
             let key = (self.key_b)(b);
-            self.b_index_to_key.insert(b_idx, key.clone());
+            self.b_index_to_key[b_idx] = Some(key.clone());
             self.b_by_key.entry(key).or_default().push(b_idx);
         }
     }
@@ -269,20 +274,23 @@ where
         if self.matches.contains_key(&pair) {
             return Sc::zero();
         }
+        // Callers only pair entities already admitted to the key indexes, so the
+        // per-side source predicates were settled once per entity, not per pair.
         let a = &entities_a[a_idx];
         let b = &entities_b[b_idx];
-        if !self.extractor_a.contains(solution, a) || !self.extractor_b.contains(solution, b) {
-            return Sc::zero();
-        }
+        debug_assert!(
+            self.extractor_a.contains(solution, a) && self.extractor_b.contains(solution, b),
+            "cross-bi pair ({a_idx}, {b_idx}) includes an entity its source rejects"
+        );
         if !(self.filter)(solution, a, b, a_idx, b_idx) {
             return Sc::zero();
         }
         let score = self.compute_score(solution, entities_a, entities_b, a_idx, b_idx);
         let row_idx = self.match_rows.len();
-        let a_bucket = self.a_to_matches.entry(a_idx).or_default();
+        let a_bucket = dense_slot(&mut self.a_to_matches, a_idx);
         let a_pos = a_bucket.len();
         a_bucket.push(row_idx);
-        let b_bucket = self.b_to_matches.entry(b_idx).or_default();
+        let b_bucket = dense_slot(&mut self.b_to_matches, b_idx);
         let b_pos = b_bucket.len();
         b_bucket.push(row_idx);
         self.match_rows.push(MatchRow {
@@ -310,46 +318,30 @@ where
         if row_idx != last_idx {
             let moved = self.match_rows[row_idx].clone();
             self.matches.insert(moved.pair, row_idx);
-            if let Some(a_matches) = self.a_to_matches.get_mut(&moved.pair.0) {
-                a_matches[moved.a_pos] = row_idx;
-            }
-            if let Some(b_matches) = self.b_to_matches.get_mut(&moved.pair.1) {
-                b_matches[moved.b_pos] = row_idx;
-            }
+            self.a_to_matches[moved.pair.0][moved.a_pos] = row_idx;
+            self.b_to_matches[moved.pair.1][moved.b_pos] = row_idx;
         }
 
         -row.score
     }
 
     pub(super) fn remove_from_a_bucket(&mut self, a_idx: usize, row_idx: usize, pos: usize) {
-        let mut remove_bucket = false;
-        if let Some(a_matches) = self.a_to_matches.get_mut(&a_idx) {
-            debug_assert_eq!(a_matches[pos], row_idx);
-            a_matches.swap_remove(pos);
-            if pos < a_matches.len() {
-                let moved_row_idx = a_matches[pos];
-                self.match_rows[moved_row_idx].a_pos = pos;
-            }
-            remove_bucket = a_matches.is_empty();
-        }
-        if remove_bucket {
-            self.a_to_matches.remove(&a_idx);
+        let a_matches = &mut self.a_to_matches[a_idx];
+        debug_assert_eq!(a_matches[pos], row_idx);
+        a_matches.swap_remove(pos);
+        if pos < a_matches.len() {
+            let moved_row_idx = a_matches[pos];
+            self.match_rows[moved_row_idx].a_pos = pos;
         }
     }
 
     pub(super) fn remove_from_b_bucket(&mut self, b_idx: usize, row_idx: usize, pos: usize) {
-        let mut remove_bucket = false;
-        if let Some(b_matches) = self.b_to_matches.get_mut(&b_idx) {
-            debug_assert_eq!(b_matches[pos], row_idx);
-            b_matches.swap_remove(pos);
-            if pos < b_matches.len() {
-                let moved_row_idx = b_matches[pos];
-                self.match_rows[moved_row_idx].b_pos = pos;
-            }
-            remove_bucket = b_matches.is_empty();
-        }
-        if remove_bucket {
-            self.b_to_matches.remove(&b_idx);
+        let b_matches = &mut self.b_to_matches[b_idx];
+        debug_assert_eq!(b_matches[pos], row_idx);
+        b_matches.swap_remove(pos);
+        if pos < b_matches.len() {
+            let moved_row_idx = b_matches[pos];
+            self.match_rows[moved_row_idx].b_pos = pos;
         }
     }
 
@@ -386,27 +378,30 @@ where
             return Sc::zero();
         }
         let key = (self.key_a)(a);
-        self.a_index_to_key.insert(a_idx, key.clone());
+        *dense_slot(&mut self.a_index_to_key, a_idx) = Some(key.clone());
         self.a_by_key.entry(key.clone()).or_default().push(a_idx);
 
-        let b_indices = self.b_by_key.get(&key).cloned().unwrap_or_default();
-
+        // add_match never touches the key index, so probe it without cloning the bucket.
+        let b_by_key = std::mem::take(&mut self.b_by_key);
         let mut total = Sc::zero();
-        for b_idx in b_indices {
-            total = total + self.add_match(solution, entities_a, entities_b, a_idx, b_idx);
+        if let Some(b_indices) = b_by_key.get(&key) {
+            for &b_idx in b_indices {
+                total = total + self.add_match(solution, entities_a, entities_b, a_idx, b_idx);
+            }
         }
+        self.b_by_key = b_by_key;
 
         total
     }
 
     pub(super) fn retract_a(&mut self, a_idx: usize) -> Sc {
-        if let Some(key) = self.a_index_to_key.remove(&a_idx) {
+        if let Some(key) = self.a_index_to_key.get_mut(a_idx).and_then(Option::take) {
             Self::remove_index_from_key_bucket(&mut self.a_by_key, &key, a_idx);
         }
         let mut total = Sc::zero();
         while let Some(row_idx) = self
             .a_to_matches
-            .get(&a_idx)
+            .get(a_idx)
             .and_then(|matches| matches.last())
             .copied()
         {
@@ -431,25 +426,28 @@ where
             return Sc::zero();
         }
         let key = (self.key_b)(b);
-        self.b_index_to_key.insert(b_idx, key.clone());
+        *dense_slot(&mut self.b_index_to_key, b_idx) = Some(key.clone());
         self.b_by_key.entry(key.clone()).or_default().push(b_idx);
 
-        let a_indices = self.a_by_key.get(&key).cloned().unwrap_or_default();
+        let a_by_key = std::mem::take(&mut self.a_by_key);
         let mut total = Sc::zero();
-        for a_idx in a_indices {
-            total = total + self.add_match(solution, entities_a, entities_b, a_idx, b_idx);
+        if let Some(a_indices) = a_by_key.get(&key) {
+            for &a_idx in a_indices {
+                total = total + self.add_match(solution, entities_a, entities_b, a_idx, b_idx);
+            }
         }
+        self.a_by_key = a_by_key;
         total
     }
 
     pub(super) fn retract_b(&mut self, b_idx: usize) -> Sc {
-        if let Some(key) = self.b_index_to_key.remove(&b_idx) {
+        if let Some(key) = self.b_index_to_key.get_mut(b_idx).and_then(Option::take) {
             Self::remove_index_from_key_bucket(&mut self.b_by_key, &key, b_idx);
         }
         let mut total = Sc::zero();
         while let Some(row_idx) = self
             .b_to_matches
-            .get(&b_idx)
+            .get(b_idx)
             .and_then(|matches| matches.last())
             .copied()
         {
@@ -459,3 +457,12 @@ where
         total
     }
 }
+
+// Grows a per-entity column so `idx` is addressable and returns its slot.
+#[inline]
+fn dense_slot<T: Default>(slots: &mut Vec<T>, idx: usize) -> &mut T {
+    if slots.len() <= idx {
+        slots.resize_with(idx + 1, T::default);
+    }
+    &mut slots[idx]
+}
@@ -4,9 +4,9 @@ The `impl_get_matches_nary!` macro generates `get_matches()` implementations
 for self-join constraints with identical structure but varying arity.
 */
 
-/* Generates `get_matches()` implementation for N-ary self-join constraints.
+/* Generates `get_matches()` implementation for higher-arity self-join constraints.
 
-All N-ary constraints share the same pattern:
+Higher-arity self-join constraints share the same pattern:
 1. Extract entities and build key index
 2. Iterate over N-tuples within each key group
 3. Filter and collect DetailedConstraintMatch with EntityRefs
@@ -17,58 +17,15 @@ This macro is used internally in constraint implementations:
 
 ```text
 fn get_matches<'a>(&'a self, solution: &S) -> Vec<DetailedConstraintMatch<'a, Sc>> {
-impl_get_matches_nary!(bi: self, solution)
+impl_get_matches_nary!(tri: self, solution)
 }
 ```
 
-Available arities: `bi`, `tri`, `quad`, `penta`
+Available arities: `tri`, `quad`, `penta`. The bi self-join walks its pairs
+through the same enumerator it uses for scoring.
 */
 #[macro_export]
 macro_rules! impl_get_matches_nary {
-    // Bi-constraint: 2 entities
-    (bi: $self:expr, $solution:expr) => {{
-        use std::collections::HashMap;
-        use $crate::api::analysis::{ConstraintJustification, DetailedConstraintMatch, EntityRef};
-
-        let entities = $crate::stream::collection_extract::CollectionExtract::extract(
-            &$self.extractor,
-            $solution,
-        );
-        let cref = $self.constraint_ref();
-
-        let mut temp_index: HashMap<_, Vec<usize>> = HashMap::new();
-        for (i, entity) in entities.iter().enumerate() {
-            let key = $crate::stream::key_extract::KeyExtract::extract(
-                &$self.key_extractor,
-                $solution,
-                entity,
-                i,
-            );
-            temp_index.entry(key).or_default().push(i);
-        }
-
-        let mut matches = Vec::new();
-        for indices in temp_index.values() {
-            for i in 0..indices.len() {
-                for j in (i + 1)..indices.len() {
-                    let idx_a = indices[i];
-                    let idx_b = indices[j];
-                    let a = &entities[idx_a];
-                    let b = &entities[idx_b];
-                    if ($self.filter)($solution, a, b, idx_a, idx_b) {
-                        let justification = ConstraintJustification::new(vec![
-                            EntityRef::new(a),
-                            EntityRef::new(b),
-                        ]);
-                        let score = $self.compute_score($solution, entities, idx_a, idx_b);
-                        matches.push(DetailedConstraintMatch::new(cref, score, justification));
-                    }
-                }
-            }
-        }
-        matches
-    }};
-
     // Tri-constraint: 3 entities
     (tri: $self:expr, $solution:expr) => {{
         use std::collections::HashMap;
@@ -80,7 +37,7 @@ macro_rules! impl_get_matches_nary {
         );
         let cref = $self.constraint_ref();
 
-        let mut temp_index: HashMap<_, Vec<usize>> = HashMap::new();
+        let mut temp_index: HashMap<_, Vec<usize>> = HashMap::with_capacity(entities.len());
         for (i, entity) in entities.iter().enumerate() {
             let key = $crate::stream::key_extract::KeyExtract::extract(
                 &$self.key_extractor,
@@ -102,7 +59,16 @@ macro_rules! impl_get_matches_nary {
                         let a = &entities[i];
                         let b = &entities[j];
                         let c = &entities[k];
-                        if ($self.filter)($solution, a, b, c, i, j, k) {
+                        if $crate::stream::collection_extract::CollectionExtract::contains(
+                            &$self.extractor,
+                            $solution,
+                            a,
+                        ) && $crate::stream::collection_extract::CollectionExtract::contains(
+                            &$self.extractor,
+                            $solution,
+                            b,
+                        ) && ($self.filter)($solution, a, b, c, i, j, k)
+                        {
                             let justification = ConstraintJustification::new(vec![
                                 EntityRef::new(a),
                                 EntityRef::new(b),
@@ -129,7 +95,7 @@ macro_rules! impl_get_matches_nary {
         );
         let cref = $self.constraint_ref();
 
-        let mut temp_index: HashMap<_, Vec<usize>> = HashMap::new();
+        let mut temp_index: HashMap<_, Vec<usize>> = HashMap::with_capacity(entities.len());
         for (i, entity) in entities.iter().enumerate() {
             let key = $crate::stream::key_extract::KeyExtract::extract(
                 &$self.key_extractor,
@@ -154,7 +120,16 @@ macro_rules! impl_get_matches_nary {
                             let b = &entities[j];
                             let c = &entities[k];
                             let d = &entities[l];
-                            if ($self.filter)($solution, a, b, c, d, i, j, k, l) {
+                            if $crate::stream::collection_extract::CollectionExtract::contains(
+                                &$self.extractor,
+                                $solution,
+                                a,
+                            ) && $crate::stream::collection_extract::CollectionExtract::contains(
+                                &$self.extractor,
+                                $solution,
+                                b,
+                            ) && ($self.filter)($solution, a, b, c, d, i, j, k, l)
+                            {
                                 let justification = ConstraintJustification::new(vec![
                                     EntityRef::new(a),
                                     EntityRef::new(b),
@@ -187,7 +162,7 @@ macro_rules! impl_get_matches_nary {
         );
         let cref = $self.constraint_ref();
 
-        let mut temp_index: HashMap<_, Vec<usize>> = HashMap::new();
+        let mut temp_index: HashMap<_, Vec<usize>> = HashMap::with_capacity(entities.len());
         for (i, entity) in entities.iter().enumerate() {
             let key = $crate::stream::key_extract::KeyExtract::extract(
                 &$self.key_extractor,
@@ -215,7 +190,16 @@ macro_rules! impl_get_matches_nary {
                                 let c = &entities[k];
                                 let d = &entities[l];
                                 let e = &entities[m];
-                                if ($self.filter)($solution, a, b, c, d, e, i, j, k, l, m) {
+                                if $crate::stream::collection_extract::CollectionExtract::contains(
+                                    &$self.extractor,
+                                    $solution,
+                                    a,
+                                ) && $crate::stream::collection_extract::CollectionExtract::contains(
+                                    &$self.extractor,
+                                    $solution,
+                                    b,
+                                ) && ($self.filter)($solution, a, b, c, d, e, i, j, k, l, m)
+                                {
                                     let justification = ConstraintJustification::new(vec![
                                         EntityRef::new(a),
                                         EntityRef::new(b),
@@ -6,9 +6,9 @@ macro_rules! impl_incremental_bi_constraint {
     ($struct_name:ident) => {
         /* Zero-erasure incremental bi-constraint for self-joins.
 
-           All function types are concrete generics - no trait objects, no Arc.
-           Uses key-based indexing: entities are grouped by join key for O(k) lookups.
-           */
+        All function types are concrete generics - no trait objects, no Arc.
+        Uses key-based indexing: entities are grouped by join key for O(k) lookups.
+        */
         pub struct $struct_name<S, A, K, E, KE, F, W, Sc>
         where
             Sc: Score,
@@ -67,7 +67,13 @@ macro_rules! impl_incremental_bi_constraint {
             }
 
             #[inline]
-            fn compute_score(&self, solution: &S, entities: &[A], a_idx: usize, b_idx: usize) -> Sc {
+            fn compute_score(
+                &self,
+                solution: &S,
+                entities: &[A],
+                a_idx: usize,
+                b_idx: usize,
+            ) -> Sc {
                 let base = (self.weight)(solution, entities, a_idx, b_idx);
                 match self.impact_type {
                     ImpactType::Penalty => -base,
@@ -75,13 +81,67 @@ macro_rules! impl_incremental_bi_constraint {
                 }
             }
 
+            fn build_index_map(&self, solution: &S, entities: &[A]) -> HashMap<K, Vec<usize>> {
+                let mut temp_index: HashMap<K, Vec<usize>> = HashMap::with_capacity(entities.len());
+                for (i, entity) in entities.iter().enumerate() {
+                    if !$crate::stream::collection_extract::CollectionExtract::contains(
+                        &self.extractor,
+                        solution,
+                        entity,
+                    ) {
+                        continue;
+                    }
+                    let key = $crate::stream::key_extract::KeyExtract::extract(
+                        &self.key_extractor,
+                        solution,
+                        entity,
+                        i,
+                    );
+                    temp_index.entry(key).or_default().push(i);
+                }
+                temp_index
+            }
+
+            /* Visits every distinct pair that shares a key bucket and passes the filter.
+            Buckets hold ascending indexes, so each pair arrives as (low, high). */
+            #[inline]
+            fn for_each_matching_pair(
+                filter: &F,
+                solution: &S,
+                entities: &[A],
+                index_map: &HashMap<K, Vec<usize>>,
+                mut visit: impl FnMut(usize, usize),
+            ) {
+                for indices in index_map.values() {
+                    for (i, &low) in indices.iter().enumerate() {
+                        for &high in &indices[i + 1..] {
+                            if filter(solution, &entities[low], &entities[high], low, high) {
+                                visit(low, high);
+                            }
+                        }
+                    }
+                }
+            }
+
             fn insert_entity(&mut self, solution: &S, entities: &[A], index: usize) -> Sc {
                 if index >= entities.len() {
                     return Sc::zero();
                 }
 
                 let entity = &entities[index];
-                let key = $crate::stream::key_extract::KeyExtract::extract(&self.key_extractor, solution, entity, index);
+                if !$crate::stream::collection_extract::CollectionExtract::contains(
+                    &self.extractor,
+                    solution,
+                    entity,
+                ) {
+                    return Sc::zero();
+                }
+                let key = $crate::stream::key_extract::KeyExtract::extract(
+                    &self.key_extractor,
+                    solution,
+                    entity,
+                    index,
+                );
 
                 self.index_to_key.insert(index, key.clone());
                 self.key_to_indices
@@ -179,64 +239,79 @@ macro_rules! impl_incremental_bi_constraint {
             Sc: Score,
         {
             fn evaluate(&self, solution: &S) -> Sc {
-                let entities = $crate::stream::collection_extract::CollectionExtract::extract(&self.extractor, solution);
-                let mut total = Sc::zero();
-
-                let mut temp_index: HashMap<K, Vec<usize>> = HashMap::new();
-                for (i, entity) in entities.iter().enumerate() {
-                    let key = $crate::stream::key_extract::KeyExtract::extract(&self.key_extractor, solution, entity, i);
-                    temp_index.entry(key).or_default().push(i);
-                }
-
-                for indices in temp_index.values() {
-                    for i in 0..indices.len() {
-                        for j in (i + 1)..indices.len() {
-                            let low = indices[i];
-                            let high = indices[j];
-                            let a = &entities[low];
-                            let b = &entities[high];
-                            if (self.filter)(solution, a, b, low, high) {
-                                total = total + self.compute_score(solution, entities, low, high);
-                            }
-                        }
-                    }
-                }
-
-                total
+                self.evaluate_with_match_count(solution).0
             }
 
             fn match_count(&self, solution: &S) -> usize {
-                let entities = $crate::stream::collection_extract::CollectionExtract::extract(&self.extractor, solution);
-                let mut count = 0;
-
-                let mut temp_index: HashMap<K, Vec<usize>> = HashMap::new();
-                for (i, entity) in entities.iter().enumerate() {
-                    let key = $crate::stream::key_extract::KeyExtract::extract(&self.key_extractor, solution, entity, i);
-                    temp_index.entry(key).or_default().push(i);
-                }
-
-                for indices in temp_index.values() {
-                    for i in 0..indices.len() {
-                        for j in (i + 1)..indices.len() {
-                            let low = indices[i];
-                            let high = indices[j];
-                            if (self.filter)(solution, &entities[low], &entities[high], low, high) {
-                                count += 1;
-                            }
-                        }
-                    }
-                }
+                self.evaluate_with_match_count(solution).1
+            }
 
-                count
+            fn evaluate_with_match_count(&self, solution: &S) -> (Sc, usize) {
+                let entities = $crate::stream::collection_extract::CollectionExtract::extract(
+                    &self.extractor,
+                    solution,
+                );
+                let index_map = self.build_index_map(solution, entities);
+                let mut total = Sc::zero();
+                let mut count = 0;
+                Self::for_each_matching_pair(
+                    &self.filter,
+                    solution,
+                    entities,
+                    &index_map,
+                    |low, high| {
+                        total = total + self.compute_score(solution, entities, low, high);
+                        count += 1;
+                    },
+                );
+                (total, count)
             }
 
             fn initialize(&mut self, solution: &S) -> Sc {
                 self.reset();
-                let entities = $crate::stream::collection_extract::CollectionExtract::extract(&self.extractor, solution);
-                let mut total = Sc::zero();
-                for i in 0..entities.len() {
-                    total = total + self.insert_entity(solution, entities, i);
+                let entities = $crate::stream::collection_extract::CollectionExtract::extract(
+                    &self.extractor,
+                    solution,
+                );
+
+                /* Bulk load: bucket every entity by key first, then enumerate each
+                bucket's distinct pairs once; no pair needs a dedup probe. */
+                let index_map = self.build_index_map(solution, entities);
+                self.index_to_key.reserve(entities.len());
+                for (key, indices) in &index_map {
+                    for &i in indices {
+                        self.index_to_key.insert(i, key.clone());
+                    }
                 }
+
+                let matches = &mut self.matches;
+                let entity_to_matches = &mut self.entity_to_matches;
+                let weight = &self.weight;
+                let impact_type = self.impact_type;
+                let mut total = Sc::zero();
+                Self::for_each_matching_pair(
+                    &self.filter,
+                    solution,
+                    entities,
+                    &index_map,
+                    |low, high| {
+                        let pair = (low, high);
+                        matches.insert(pair);
+                        entity_to_matches.entry(low).or_default().insert(pair);
+                        entity_to_matches.entry(high).or_default().insert(pair);
+                        let base = weight(solution, entities, low, high);
+                        total = total
+                            + match impact_type {
+                                ImpactType::Penalty => -base,
+                                ImpactType::Reward => base,
+                            };
+                    },
+                );
+
+                self.key_to_indices = index_map
+                    .into_iter()
+                    .map(|(key, indices)| (key, indices.into_iter().collect()))
+                    .collect();
                 total
             }
 
@@ -252,7 +327,10 @@ macro_rules! impl_incremental_bi_constraint {
                 {
                     return Sc::zero();
                 }
-                let entities = $crate::stream::collection_extract::CollectionExtract::extract(&self.extractor, solution);
+                let entities = $crate::stream::collection_extract::CollectionExtract::extract(
+                    &self.extractor,
+                    solution,
+                );
                 self.insert_entity(solution, entities, entity_index)
             }
 
@@ -268,7 +346,10 @@ macro_rules! impl_incremental_bi_constraint {
                 {
                     return Sc::zero();
                 }
-                let entities = $crate::stream::collection_extract::CollectionExtract::extract(&self.extractor, solution);
+                let entities = $crate::stream::collection_extract::CollectionExtract::extract(
+                    &self.extractor,
+                    solution,
+                );
                 self.retract_entity(solution, entities, entity_index)
             }
 
@@ -288,11 +369,34 @@ macro_rules! impl_incremental_bi_constraint {
             }
 
             fn constraint_ref(&self) -> &ConstraintRef {
-        &self.constraint_ref
-    }
+                &self.constraint_ref
+            }
 
             fn get_matches<'a>(&'a self, solution: &S) -> Vec<DetailedConstraintMatch<'a, Sc>> {
-                $crate::impl_get_matches_nary!(bi: self, solution)
+                use $crate::api::analysis::{ConstraintJustification, EntityRef};
+
+                let entities = $crate::stream::collection_extract::CollectionExtract::extract(
+                    &self.extractor,
+                    solution,
+                );
+                let index_map = self.build_index_map(solution, entities);
+                let cref = self.constraint_ref();
+                let mut matches = Vec::new();
+                Self::for_each_matching_pair(
+                    &self.filter,
+                    solution,
+                    entities,
+                    &index_map,
+                    |low, high| {
+                        let justification = ConstraintJustification::new(vec![
+                            EntityRef::new(&entities[low]),
+                            EntityRef::new(&entities[high]),
+                        ]);
+                        let score = self.compute_score(solution, entities, low, high);
+                        matches.push(DetailedConstraintMatch::new(cref, score, justification));
+                    },
+                );
+                matches
             }
         }
 
@@ -153,8 +153,30 @@ macro_rules! impl_incremental_higher_arity_constraint_common {
                 }
             }
 
+            /* A filtered self-join carries its uni filter as the extractor's
+            `contains`. Chained joins keep that filter on the two lowest-indexed
+            members of each tuple, where the bi pair filter used to apply it. */
+            #[inline]
+            fn admits_leading_pair(
+                extractor: &E,
+                solution: &S,
+                entities: &[A],
+                first: usize,
+                second: usize,
+            ) -> bool {
+                $crate::stream::collection_extract::CollectionExtract::contains(
+                    extractor,
+                    solution,
+                    &entities[first],
+                ) && $crate::stream::collection_extract::CollectionExtract::contains(
+                    extractor,
+                    solution,
+                    &entities[second],
+                )
+            }
+
             fn build_index_map(&self, solution: &S, entities: &[A]) -> HashMap<K, Vec<usize>> {
-                let mut temp_index: HashMap<K, Vec<usize>> = HashMap::new();
+                let mut temp_index: HashMap<K, Vec<usize>> = HashMap::with_capacity(entities.len());
                 for (i, entity) in entities.iter().enumerate() {
                     let key = $crate::stream::key_extract::KeyExtract::extract(
                         &self.key_extractor,
@@ -186,6 +208,7 @@ macro_rules! impl_incremental_higher_arity_constraint_common {
                     .or_default()
                     .insert(index);
 
+                let extractor = &self.extractor;
                 let key_to_indices = &self.key_to_indices;
                 let matches = &mut self.matches;
                 let entity_to_matches = &mut self.entity_to_matches;
@@ -207,7 +230,10 @@ macro_rules! impl_incremental_higher_arity_constraint_common {
 
                         $(let $entity = &entities[$match_idx];)+
 
-	                        if filter(solution, $($entity),+, $($match_idx),+) && matches.insert(match_tuple) {
+                        if Self::admits_leading_pair(extractor, solution, entities, arr[0], arr[1])
+                            && filter(solution, $($entity),+, $($match_idx),+)
+                            && matches.insert(match_tuple)
+                        {
                             $(entity_to_matches.entry($match_idx).or_default().insert(match_tuple);)+
                             let base = weight(solution, entities, $($match_idx),+);
                             let score = match impact_type {
@@ -292,8 +318,11 @@ macro_rules! impl_incremental_higher_arity_constraint_common {
                         positions = [$($combo_pos),+],
                         values = [$($combo_value),+],
                         {
+                            let combo = [$($combo_value),+];
                             $(let $entity = &entities[$combo_value];)+
-	                            if (self.filter)(solution, $($entity),+, $($combo_value),+) {
+                            if Self::admits_leading_pair(&self.extractor, solution, entities, combo[0], combo[1])
+                                && (self.filter)(solution, $($entity),+, $($combo_value),+)
+                            {
                                 total = total + self.compute_score(solution, entities, ($($combo_value),+));
                             }
                         }
@@ -317,7 +346,10 @@ macro_rules! impl_incremental_higher_arity_constraint_common {
                         positions = [$($combo_pos),+],
                         values = [$($combo_value),+],
                         {
-	                            if (self.filter)(solution, $(&entities[$combo_value]),+, $($combo_value),+) {
+                            let combo = [$($combo_value),+];
+                            if Self::admits_leading_pair(&self.extractor, solution, entities, combo[0], combo[1])
+                                && (self.filter)(solution, $(&entities[$combo_value]),+, $($combo_value),+)
+                            {
                                 count += 1;
                             }
                         }
@@ -309,3 +309,149 @@ fn test_out_of_bounds() {
     assert_eq!(constraint.on_insert(&solution, 100, 0), SoftScore::of(0));
     assert_eq!(constraint.on_retract(&solution, 100, 0), SoftScore::of(0));
 }
+
+#[test]
+fn test_initialize_bulk_load_supports_incremental_updates() {
+    let mut constraint = IncrementalBiConstraint::new(
+        ConstraintRef::new("", "Row conflict"),
+        ImpactType::Penalty,
+        source(
+            (|s: &NQueensSolution| s.queens.as_slice()) as fn(&NQueensSolution) -> &[Queen],
+            ChangeSource::Descriptor(0),
+        ),
+        |_s: &NQueensSolution, q: &Queen, _idx: usize| q.row,
+        |_s: &NQueensSolution, a: &Queen, b: &Queen, _ai: usize, _bi: usize| a.col < b.col,
+        |_s: &NQueensSolution, _entities: &[Queen], _a_idx: usize, _b_idx: usize| SoftScore::of(1),
+        false,
+    );
+
+    let mut solution = NQueensSolution {
+        queens: vec![
+            Queen { row: 0, col: 0 },
+            Queen { row: 0, col: 1 },
+            Queen { row: 1, col: 2 },
+            Queen { row: 0, col: 3 },
+        ],
+    };
+
+    let mut total = constraint.initialize(&solution);
+    assert_eq!(total, SoftScore::of(-3));
+    assert_eq!(total, constraint.evaluate(&solution));
+
+    // Move queen 1 onto row 1: drops two row-0 pairs, adds one row-1 pair.
+    total = total + constraint.on_retract(&solution, 1, 0);
+    solution.queens[1].row = 1;
+    total = total + constraint.on_insert(&solution, 1, 0);
+    assert_eq!(total, SoftScore::of(-2));
+    assert_eq!(total, constraint.evaluate(&solution));
+}
+
+#[test]
+fn test_get_matches_agrees_with_evaluate() {
+    let constraint = IncrementalBiConstraint::new(
+        ConstraintRef::new("", "Row conflict"),
+        ImpactType::Penalty,
+        source(
+            (|s: &NQueensSolution| s.queens.as_slice()) as fn(&NQueensSolution) -> &[Queen],
+            ChangeSource::Descriptor(0),
+        ),
+        |_s: &NQueensSolution, q: &Queen, _idx: usize| q.row,
+        |_s: &NQueensSolution, a: &Queen, b: &Queen, _ai: usize, _bi: usize| a.col < b.col,
+        |_s: &NQueensSolution, _entities: &[Queen], _a_idx: usize, _b_idx: usize| SoftScore::of(1),
+        false,
+    );
+
+    let solution = NQueensSolution {
+        queens: vec![
+            Queen { row: 0, col: 0 },
+            Queen { row: 1, col: 1 },
+            Queen { row: 0, col: 2 },
+            Queen { row: 1, col: 3 },
+            Queen { row: 0, col: 4 },
+        ],
+    };
+
+    let matches = constraint.get_matches(&solution);
+    assert_eq!(matches.len(), 4);
+    assert!(matches
+        .iter()
+        .all(|constraint_match| constraint_match.justification.entities.len() == 2));
+    let total = matches
+        .iter()
+        .fold(SoftScore::of(0), |total, constraint_match| {
+            total + constraint_match.score
+        });
+    assert_eq!(total, constraint.evaluate(&solution));
+}
+
+#[test]
+fn test_evaluate_each_reports_score_and_match_count() {
+    let constraint = IncrementalBiConstraint::new(
+        ConstraintRef::new("", "Row conflict"),
+        ImpactType::Penalty,
+        source(
+            (|s: &NQueensSolution| s.queens.as_slice()) as fn(&NQueensSolution) -> &[Queen],
+            ChangeSource::Descriptor(0),
+        ),
+        |_s: &NQueensSolution, q: &Queen, _idx: usize| q.row,
+        |_s: &NQueensSolution, a: &Queen, b: &Queen, _ai: usize, _bi: usize| a.col < b.col,
+        |_s: &NQueensSolution, _entities: &[Queen], _a_idx: usize, _b_idx: usize| SoftScore::of(1),
+        false,
+    );
+
+    let solution = NQueensSolution {
+        queens: vec![
+            Queen { row: 0, col: 0 },
+            Queen { row: 1, col: 1 },
+            Queen { row: 0, col: 2 },
+            Queen { row: 2, col: 3 },
+        ],
+    };
+
+    let results = constraint.evaluate_each(&solution);
+    assert_eq!(results.len(), 1);
+    assert_eq!(results[0].score, SoftScore::of(-1));
+    assert_eq!(results[0].match_count, 1);
+    assert_eq!(results[0].score, constraint.evaluate(&solution));
+    assert_eq!(results[0].match_count, constraint.match_count(&solution));
+}
+
+#[test]
+fn test_filtered_self_join_screens_entities_before_pairing() {
+    use crate::stream::joiner::equal;
+    use crate::stream::ConstraintFactory;
+
+    let mut constraint = ConstraintFactory::<NQueensSolution, SoftScore>::new()
+        .for_each(source(
+            (|s: &NQueensSolution| s.queens.as_slice()) as fn(&NQueensSolution) -> &[Queen],
+            ChangeSource::Descriptor(0),
+        ))
+        .filter(|q: &Queen| q.row >= 0)
+        .join(equal(|q: &Queen| q.row))
+        .penalize(SoftScore::of(1))
+        .named("Placed row conflict");
+
+    let mut solution = NQueensSolution {
+        queens: vec![
+            Queen { row: -1, col: 0 },
+            Queen { row: -1, col: 1 },
+            Queen { row: 2, col: 2 },
+            Queen { row: 2, col: 3 },
+        ],
+    };
+
+    assert_eq!(constraint.evaluate(&solution), SoftScore::of(-1));
+    assert_eq!(constraint.initialize(&solution), SoftScore::of(-1));
+
+    let mut total = SoftScore::of(-1);
+    total = total + constraint.on_retract(&solution, 0, 0);
+    solution.queens[0].row = 2;
+    total = total + constraint.on_insert(&solution, 0, 0);
+    assert_eq!(total, SoftScore::of(-3));
+
+    total = total + constraint.on_retract(&solution, 2, 0);
+    solution.queens[2].row = -1;
+    total = total + constraint.on_insert(&solution, 2, 0);
+    assert_eq!(total, SoftScore::of(-1));
+    assert_eq!(total, constraint.evaluate(&solution));
+}
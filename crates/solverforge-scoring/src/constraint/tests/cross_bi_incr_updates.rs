@@ -0,0 +1,96 @@
+use super::cross_bi_incr::{
+    create_unavailable_employee_constraint, sample_schedule, Employee, Schedule, Shift,
+};
+use crate::api::constraint_set::IncrementalConstraint;
+use crate::constraint::cross_bi_incremental::Bi as CrossBiConstraint;
+use crate::stream::collection_extract::{source, ChangeSource};
+use solverforge_core::score::{Score, SoftScore};
+use solverforge_core::{ConstraintRef, ImpactType};
+
+#[test]
+fn test_cross_bi_incremental_updates_still_work() {
+    let mut constraint = create_unavailable_employee_constraint();
+    let schedule = sample_schedule();
+
+    let initial = constraint.initialize(&schedule);
+    assert_eq!(initial, SoftScore::of(-1));
+
+    let delta = constraint.on_retract(&schedule, 0, 0);
+    assert_eq!(delta, SoftScore::of(1));
+
+    let delta = constraint.on_insert(&schedule, 0, 0);
+    assert_eq!(delta, SoftScore::of(-1));
+}
+
+#[test]
+fn cross_bi_b_side_retract_and_insert_update_matches() {
+    let mut constraint = create_unavailable_employee_constraint();
+    let mut schedule = sample_schedule();
+
+    let mut total = constraint.initialize(&schedule);
+    assert_eq!(total, SoftScore::of(-1));
+
+    total = total + constraint.on_retract(&schedule, 0, 1);
+    schedule.employees[0].unavailable_days = vec![6];
+    total = total + constraint.on_insert(&schedule, 0, 1);
+
+    assert_eq!(total, SoftScore::of(-1));
+    assert_eq!(total, constraint.evaluate(&schedule));
+}
+
+#[test]
+fn cross_bi_insert_grows_past_initialized_entities() {
+    let mut constraint = create_unavailable_employee_constraint();
+    let mut schedule = sample_schedule();
+
+    let mut total = constraint.initialize(&schedule);
+    let extra = schedule.shifts[0].clone();
+    schedule.shifts.push(extra);
+    total = total + constraint.on_insert(&schedule, 2, 0);
+    assert_eq!(total, SoftScore::of(-2));
+    assert_eq!(total, constraint.evaluate(&schedule));
+
+    total = total + constraint.on_retract(&schedule, 2, 0);
+    assert_eq!(total, SoftScore::of(-1));
+}
+
+#[test]
+fn cross_bi_unrelated_descriptor_is_noop() {
+    let mut constraint = create_unavailable_employee_constraint();
+    let schedule = sample_schedule();
+
+    let initial = constraint.initialize(&schedule);
+    let delta = constraint.on_retract(&schedule, 0, 2);
+
+    assert_eq!(initial, SoftScore::of(-1));
+    assert_eq!(delta, SoftScore::zero());
+}
+
+#[test]
+#[should_panic(expected = "cannot localize entity indexes")]
+fn cross_bi_unknown_source_panics_on_localized_callback() {
+    let mut constraint = CrossBiConstraint::new(
+        ConstraintRef::new("", "Unavailable employee"),
+        ImpactType::Penalty,
+        (|schedule: &Schedule| schedule.shifts.as_slice()) as fn(&Schedule) -> &[Shift],
+        source(
+            (|schedule: &Schedule| schedule.employees.as_slice()) as fn(&Schedule) -> &[Employee],
+            ChangeSource::Descriptor(1),
+        ),
+        |shift: &Shift| shift.employee_id,
+        |employee: &Employee| Some(employee.id),
+        |_schedule: &Schedule,
+         shift: &Shift,
+         employee: &Employee,
+         _shift_idx: usize,
+         _employee_idx: usize| {
+            shift.employee_id.is_some() && employee.unavailable_days.contains(&shift.day)
+        },
+        |_schedule: &Schedule, _shift_idx: usize, _employee_idx: usize| SoftScore::of(1),
+        false,
+    );
+    let schedule = sample_schedule();
+
+    constraint.initialize(&schedule);
+    constraint.on_insert(&schedule, 0, 0);
+}
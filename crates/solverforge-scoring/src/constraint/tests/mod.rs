@@ -2,6 +2,7 @@ mod balance;
 mod bi_incr;
 mod complemented;
 mod cross_bi_incr;
+mod cross_bi_incr_updates;
 mod cross_complemented_grouped;
 mod cross_grouped;
 mod exists;
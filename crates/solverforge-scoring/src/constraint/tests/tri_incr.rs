@@ -200,3 +200,66 @@ fn test_tri_constraint_reward() {
     // One triple = +5 reward
     assert_eq!(constraint.evaluate(&solution), SoftScore::of(5));
 }
+
+#[derive(Clone, Debug, Hash, PartialEq, Eq)]
+struct Member {
+    team: u32,
+    active: bool,
+}
+
+#[derive(Clone)]
+struct Roster {
+    members: Vec<Member>,
+}
+
+#[test]
+fn filtered_self_join_chain_screens_leading_pair() {
+    use crate::stream::joiner::equal;
+    use crate::stream::ConstraintFactory;
+
+    let mut constraint = ConstraintFactory::<Roster, SoftScore>::new()
+        .for_each(source(
+            (|r: &Roster| r.members.as_slice()) as fn(&Roster) -> &[Member],
+            ChangeSource::Descriptor(0),
+        ))
+        .filter(|m: &Member| m.active)
+        .join(equal(|m: &Member| m.team))
+        .join(equal(|m: &Member| m.team))
+        .penalize(SoftScore::of(1))
+        .named("Active team cluster");
+
+    // The filter applies to the two lowest-indexed members of each triple, so
+    // the inactive member at the top of the team-1 bucket still closes triples.
+    let mut roster = Roster {
+        members: vec![
+            Member {
+                team: 1,
+                active: true,
+            },
+            Member {
+                team: 1,
+                active: true,
+            },
+            Member {
+                team: 1,
+                active: true,
+            },
+            Member {
+                team: 1,
+                active: false,
+            },
+        ],
+    };
+
+    assert_eq!(constraint.evaluate(&roster), SoftScore::of(-4));
+    assert_eq!(constraint.match_count(&roster), 4);
+    let mut total = constraint.initialize(&roster);
+    assert_eq!(total, SoftScore::of(-4));
+
+    total = total + constraint.on_retract(&roster, 2, 0);
+    roster.members[2].active = false;
+    total = total + constraint.on_insert(&roster, 2, 0);
+    assert_eq!(total, SoftScore::of(-2));
+    assert_eq!(total, constraint.evaluate(&roster));
+    assert_eq!(constraint.get_matches(&roster).len(), 2);
+}
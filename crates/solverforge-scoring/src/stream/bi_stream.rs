@@ -46,6 +46,7 @@ use crate::constraint::IncrementalBiConstraint;
 
 use super::filter::{BiFilter, FnTriFilter, TriFilter};
 use super::joiner::Joiner;
+use super::key_extract::KeyExtract;
 use super::tri_stream::TriConstraintStream;
 
 super::arity_stream_macros::impl_arity_stream!(
@@ -62,7 +63,7 @@ where
     A: Clone + Hash + PartialEq + Send + Sync + 'static,
     K: Eq + Hash + Clone + Send + Sync,
     E: super::collection_extract::CollectionExtract<S, Item = A>,
-    KE: Fn(&S, &A, usize) -> K + Send + Sync,
+    KE: KeyExtract<S, A, K>,
     F: BiFilter<S, A, A>,
     Sc: Score + 'static,
 {
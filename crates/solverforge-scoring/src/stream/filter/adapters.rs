@@ -4,34 +4,6 @@ use std::marker::PhantomData;
 
 use super::traits::{BiFilter, UniFilter};
 
-// Applies a uni-filter to both elements of a pair (for self-joins).
-pub struct UniBiFilter<F, A> {
-    filter: F,
-    _phantom: PhantomData<fn() -> A>,
-}
-
-impl<F, A> UniBiFilter<F, A> {
-    // Creates a bi-filter from a uni-filter.
-    #[inline]
-    pub fn new(filter: F) -> Self {
-        Self {
-            filter,
-            _phantom: PhantomData,
-        }
-    }
-}
-
-impl<S, F, A> BiFilter<S, A, A> for UniBiFilter<F, A>
-where
-    F: UniFilter<S, A>,
-    A: Send + Sync,
-{
-    #[inline]
-    fn test(&self, solution: &S, a: &A, b: &A, _a_idx: usize, _b_idx: usize) -> bool {
-        self.filter.test(solution, a) && self.filter.test(solution, b)
-    }
-}
-
 // Applies a uni-filter to the left element of a cross-entity pair.
 pub struct UniLeftBiFilter<F, B> {
     filter: F,
@@ -9,7 +9,7 @@ mod composition;
 mod traits;
 mod wrappers;
 
-pub use adapters::{PairFilter, UniBiFilter, UniLeftBiFilter};
+pub use adapters::{PairFilter, UniLeftBiFilter};
 pub use composition::{AndBiFilter, AndPentaFilter, AndQuadFilter, AndTriFilter, AndUniFilter};
 pub use traits::{BiFilter, PentaFilter, QuadFilter, TriFilter, UniFilter};
 pub use wrappers::{FnBiFilter, FnPentaFilter, FnQuadFilter, FnTriFilter, FnUniFilter, TrueFilter};
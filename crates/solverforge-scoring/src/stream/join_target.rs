@@ -13,7 +13,7 @@ use solverforge_core::score::Score;
 use super::bi_stream::BiConstraintStream;
 use super::collection_extract::CollectionExtract;
 use super::cross_bi_stream::Bi;
-use super::filter::{PairFilter, UniBiFilter, UniFilter, UniLeftBiFilter};
+use super::filter::{PairFilter, TrueFilter, UniFilter, UniLeftBiFilter};
 use super::joiner::{EqualJoiner, Symmetric};
 use super::key_extract::EntityKeyAdapter;
 use super::UniConstraintStream;
@@ -44,13 +44,26 @@ where
     KA: Fn(&A) -> K + Send + Sync,
     Sc: Score + 'static,
 {
-    type Output = BiConstraintStream<S, A, K, E, EntityKeyAdapter<KA>, UniBiFilter<F, A>, Sc>;
+    type Output = BiConstraintStream<
+        S,
+        A,
+        K,
+        UniConstraintStream<S, A, E, F, Sc>,
+        EntityKeyAdapter<KA>,
+        TrueFilter,
+        Sc,
+    >;
 
+    /* The left stream's filter travels as the extractor's `contains` predicate,
+    so self-join constraints screen each entity once while bucketing it
+    instead of re-testing both sides of every candidate pair. */
     fn apply(self, extractor_a: E, filter_a: F) -> Self::Output {
         let (key_fn, _) = self.into_keys();
         let key_extractor = EntityKeyAdapter::new(key_fn);
-        let bi_filter = UniBiFilter::new(filter_a);
-        BiConstraintStream::new_self_join_with_filter(extractor_a, key_extractor, bi_filter)
+        BiConstraintStream::new_self_join(
+            UniConstraintStream::from_parts(extractor_a, filter_a),
+            key_extractor,
+        )
     }
 }
 
@@ -51,6 +51,7 @@ use crate::constraint::IncrementalQuadConstraint;
 use super::collection_extract::CollectionExtract;
 use super::filter::{FnPentaFilter, PentaFilter, QuadFilter};
 use super::joiner::Joiner;
+use super::key_extract::KeyExtract;
 use super::penta_stream::PentaConstraintStream;
 
 super::arity_stream_macros::impl_arity_stream!(
@@ -67,7 +68,7 @@ where
     A: Clone + Hash + PartialEq + Send + Sync + 'static,
     K: Eq + Hash + Clone + Send + Sync,
     E: CollectionExtract<S, Item = A>,
-    KE: Fn(&S, &A, usize) -> K + Send + Sync,
+    KE: KeyExtract<S, A, K>,
     F: QuadFilter<S, A, A, A, A>,
     Sc: Score + 'static,
 {
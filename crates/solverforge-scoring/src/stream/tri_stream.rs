@@ -49,6 +49,7 @@ use crate::constraint::IncrementalTriConstraint;
 use super::collection_extract::CollectionExtract;
 use super::filter::{FnQuadFilter, QuadFilter, TriFilter};
 use super::joiner::Joiner;
+use super::key_extract::KeyExtract;
 use super::quad_stream::QuadConstraintStream;
 
 super::arity_stream_macros::impl_arity_stream!(
@@ -65,7 +66,7 @@ where
     A: Clone + Hash + PartialEq + Send + Sync + 'static,
     K: Eq + Hash + Clone + Send + Sync,
     E: CollectionExtract<S, Item = A>,
-    KE: Fn(&S, &A, usize) -> K + Send + Sync,
+    KE: KeyExtract<S, A, K>,
     F: TriFilter<S, A, A, A>,
     Sc: Score + 'static,
 {
@@ -23,6 +23,18 @@ pub(crate) fn collect_bindings(descriptor: &SolutionDescriptor) -> Vec<VariableB
                 getter,
                 setter,
                 value_range_provider: variable.value_range_provider,
+                value_range_fact_index: variable.value_range_provider.and_then(|provider| {
+                    descriptor
+                        .problem_fact_descriptors
+                        .iter()
+                        .position(|fact| fact.solution_field == provider)
+                }),
+                value_range_entity_index: variable.value_range_provider.and_then(|provider| {
+                    descriptor
+                        .entity_descriptors
+                        .iter()
+                        .position(|entity| entity.solution_field == provider)
+                }),
                 provider: variable.entity_value_provider,
                 candidate_values: variable.candidate_values,
                 nearby_value_candidates: variable.nearby_value_candidates,
@@ -20,6 +20,9 @@ pub(crate) struct VariableBinding {
     pub(crate) getter: UsizeGetter,
     pub(crate) setter: UsizeSetter,
     pub(crate) value_range_provider: Option<&'static str>,
+    // Provider positions resolved once from `value_range_provider`.
+    pub(crate) value_range_fact_index: Option<usize>,
+    pub(crate) value_range_entity_index: Option<usize>,
     pub(crate) provider: Option<UsizeEntityValueProvider>,
     pub(crate) candidate_values: Option<UsizeCandidateValues>,
     pub(crate) nearby_value_candidates: Option<UsizeCandidateValues>,
@@ -174,22 +177,16 @@ impl VariableBinding {
         solution_descriptor: &SolutionDescriptor,
         solution: &dyn Any,
     ) -> Option<usize> {
-        self.value_range_provider.and_then(|provider_name| {
-            solution_descriptor
-                .problem_fact_descriptors
-                .iter()
-                .find(|descriptor| descriptor.solution_field == provider_name)
-                .and_then(|descriptor| descriptor.extractor.as_ref())
-                .and_then(|extractor| extractor.count(solution))
-                .or_else(|| {
-                    solution_descriptor
-                        .entity_descriptors
-                        .iter()
-                        .find(|descriptor| descriptor.solution_field == provider_name)
-                        .and_then(|descriptor| descriptor.extractor.as_ref())
-                        .and_then(|extractor| extractor.count(solution))
-                })
-        })
+        self.value_range_fact_index
+            .and_then(|index| solution_descriptor.problem_fact_descriptors.get(index))
+            .and_then(|descriptor| descriptor.extractor.as_ref())
+            .and_then(|extractor| extractor.count(solution))
+            .or_else(|| {
+                self.value_range_entity_index
+                    .and_then(|index| solution_descriptor.entity_descriptors.get(index))
+                    .and_then(|descriptor| descriptor.extractor.as_ref())
+                    .and_then(|extractor| extractor.count(solution))
+            })
     }
 
     pub(crate) fn has_unspecified_value_range(&self) -> bool {
@@ -68,81 +68,65 @@ impl<S> Debug for ScalarRecreateValueSource<S> {
 }
 
 impl<S> ScalarRecreateValueSource<S> {
-    pub fn values_for_entity(&self, solution: &S, entity_index: usize) -> Vec<usize> {
-        match self {
-            Self::Empty => Vec::new(),
-            Self::CountableRange { from, to } => (*from..*to).collect(),
+    /* Values are addressed by position so recreate can walk a range or slice
+    without materializing it; the count already honors the candidate limit. */
+    pub(crate) fn value_count(&self, solution: &S, entity_index: usize) -> usize {
+        let (count, limit) = match self {
+            Self::Empty => (0, None),
+            Self::CountableRange { from, to } => (to.saturating_sub(*from), None),
             Self::SolutionCount {
                 count_fn,
                 provider_index,
                 value_candidate_limit,
-            } => match value_candidate_limit {
-                Some(limit) => (0..count_fn(solution, *provider_index))
-                    .take(*limit)
-                    .collect(),
-                None => (0..count_fn(solution, *provider_index)).collect(),
-            },
+            } => (count_fn(solution, *provider_index), *value_candidate_limit),
             Self::EntitySlice {
                 values_for_entity,
                 variable_index,
                 value_candidate_limit,
-            } => {
-                let values = values_for_entity(solution, entity_index, *variable_index);
-                match value_candidate_limit {
-                    Some(limit) => values.iter().copied().take(*limit).collect(),
-                    None => values.to_vec(),
-                }
-            }
+            } => (
+                values_for_entity(solution, entity_index, *variable_index).len(),
+                *value_candidate_limit,
+            ),
             Self::CandidateSlice {
                 candidate_values,
                 variable_index,
                 value_candidate_limit,
-            } => {
-                let values = candidate_values(solution, entity_index, *variable_index);
-                match value_candidate_limit {
-                    Some(limit) => values.iter().copied().take(*limit).collect(),
-                    None => values.to_vec(),
-                }
-            }
-        }
+            } => (
+                candidate_values(solution, entity_index, *variable_index).len(),
+                *value_candidate_limit,
+            ),
+        };
+        limit.map_or(count, |limit| count.min(limit))
     }
 
-    pub fn has_values_for_entity(&self, solution: &S, entity_index: usize) -> bool {
+    /* `value_index` must be below `value_count` for the same entity. */
+    pub(crate) fn value_at(&self, solution: &S, entity_index: usize, value_index: usize) -> usize {
         match self {
-            Self::Empty => false,
-            Self::CountableRange { from, to } => from < to,
-            Self::SolutionCount {
-                count_fn,
-                provider_index,
-                value_candidate_limit,
-            } => {
-                let count = count_fn(solution, *provider_index);
-                value_candidate_limit.map_or_else(|| count > 0, |limit| limit > 0 && count > 0)
-            }
+            Self::Empty => unreachable!("empty recreate value source has no values"),
+            Self::CountableRange { from, .. } => from + value_index,
+            Self::SolutionCount { .. } => value_index,
             Self::EntitySlice {
                 values_for_entity,
                 variable_index,
-                value_candidate_limit,
-            } => {
-                let values = values_for_entity(solution, entity_index, *variable_index);
-                value_candidate_limit.map_or_else(
-                    || !values.is_empty(),
-                    |limit| limit > 0 && !values.is_empty(),
-                )
-            }
+                ..
+            } => values_for_entity(solution, entity_index, *variable_index)[value_index],
             Self::CandidateSlice {
                 candidate_values,
                 variable_index,
-                value_candidate_limit,
-            } => {
-                let values = candidate_values(solution, entity_index, *variable_index);
-                value_candidate_limit.map_or_else(
-                    || !values.is_empty(),
-                    |limit| limit > 0 && !values.is_empty(),
-                )
-            }
+                ..
+            } => candidate_values(solution, entity_index, *variable_index)[value_index],
         }
     }
+
+    pub fn values_for_entity(&self, solution: &S, entity_index: usize) -> Vec<usize> {
+        (0..self.value_count(solution, entity_index))
+            .map(|value_index| self.value_at(solution, entity_index, value_index))
+            .collect()
+    }
+
+    pub fn has_values_for_entity(&self, solution: &S, entity_index: usize) -> bool {
+        self.value_count(solution, entity_index) > 0
+    }
 }
 
 pub struct RuinRecreateMove<S> {
@@ -260,10 +244,15 @@ where
         let baseline_score = self
             .allows_unassigned
             .then(|| score_director.calculate_score());
-        for value in self
+        let value_count = self
             .value_source
-            .values_for_entity(score_director.working_solution(), entity_index)
-        {
+            .value_count(score_director.working_solution(), entity_index);
+        for value_index in 0..value_count {
+            let value = self.value_source.value_at(
+                score_director.working_solution(),
+                entity_index,
+                value_index,
+            );
             let mov = ChangeMove::new(
                 entity_index,
                 Some(value),
@@ -298,12 +287,15 @@ where
             .then(|| score_director.calculate_score());
         let mut best: Option<(usize, usize, S::Score)> = None;
 
-        for (value_index, value) in self
+        let value_count = self
             .value_source
-            .values_for_entity(score_director.working_solution(), entity_index)
-            .into_iter()
-            .enumerate()
-        {
+            .value_count(score_director.working_solution(), entity_index);
+        for value_index in 0..value_count {
+            let value = self.value_source.value_at(
+                score_director.working_solution(),
+                entity_index,
+                value_index,
+            );
             let mov = ChangeMove::new(
                 entity_index,
                 Some(value),
@@ -130,6 +130,7 @@ mod list_telemetry;
 mod pillar_change;
 mod pillar_swap;
 mod ruin;
+mod ruin_recreate;
 mod sublist_change;
 mod sublist_swap;
 mod swap;
@@ -0,0 +1,320 @@
+// Tests for RuinRecreateMove value sources and recreate heuristics.
+
+use super::*;
+use solverforge_config::RecreateHeuristicType;
+use solverforge_core::ConstraintRef;
+use solverforge_scoring::{IncrementalConstraint, IncrementalConstraintSealed};
+
+#[derive(Clone, Debug)]
+struct Shift {
+    worker: Option<usize>,
+    candidates: Vec<usize>,
+}
+
+#[derive(Clone, Debug)]
+struct Roster {
+    shifts: Vec<Shift>,
+    worker_scores: Vec<i64>,
+    score: Option<SoftScore>,
+}
+
+impl PlanningSolution for Roster {
+    type Score = SoftScore;
+    fn score(&self) -> Option<Self::Score> {
+        self.score
+    }
+    fn set_score(&mut self, score: Option<Self::Score>) {
+        self.score = score;
+    }
+}
+
+fn get_shifts(s: &Roster) -> &Vec<Shift> {
+    &s.shifts
+}
+fn get_shifts_mut(s: &mut Roster) -> &mut Vec<Shift> {
+    &mut s.shifts
+}
+
+fn get_worker(s: &Roster, idx: usize, _variable_index: usize) -> Option<usize> {
+    s.shifts.get(idx).and_then(|shift| shift.worker)
+}
+fn set_worker(s: &mut Roster, idx: usize, _variable_index: usize, v: Option<usize>) {
+    if let Some(shift) = s.shifts.get_mut(idx) {
+        shift.worker = v;
+    }
+}
+
+fn worker_count(s: &Roster, _provider_index: usize) -> usize {
+    s.worker_scores.len()
+}
+
+fn shift_candidates(s: &Roster, idx: usize, _variable_index: usize) -> &[usize] {
+    &s.shifts[idx].candidates
+}
+
+fn roster_score(s: &Roster) -> SoftScore {
+    SoftScore::of(
+        s.shifts
+            .iter()
+            .filter_map(|shift| shift.worker)
+            .map(|worker| s.worker_scores[worker])
+            .sum(),
+    )
+}
+
+struct RosterScoreConstraint {
+    constraint_ref: ConstraintRef,
+    current_score: SoftScore,
+}
+
+impl IncrementalConstraintSealed for RosterScoreConstraint {}
+
+impl IncrementalConstraint<Roster, SoftScore> for RosterScoreConstraint {
+    fn evaluate(&self, solution: &Roster) -> SoftScore {
+        roster_score(solution)
+    }
+
+    fn match_count(&self, _solution: &Roster) -> usize {
+        1
+    }
+
+    fn initialize(&mut self, solution: &Roster) -> SoftScore {
+        self.current_score = self.evaluate(solution);
+        self.current_score
+    }
+
+    fn on_insert(
+        &mut self,
+        solution: &Roster,
+        _entity_index: usize,
+        _descriptor_index: usize,
+    ) -> SoftScore {
+        let next_score = self.evaluate(solution);
+        let delta = next_score - self.current_score;
+        self.current_score = next_score;
+        delta
+    }
+
+    fn on_retract(
+        &mut self,
+        _solution: &Roster,
+        _entity_index: usize,
+        _descriptor_index: usize,
+    ) -> SoftScore {
+        SoftScore::ZERO
+    }
+
+    fn reset(&mut self) {
+        self.current_score = SoftScore::ZERO;
+    }
+
+    fn constraint_ref(&self) -> &ConstraintRef {
+        &self.constraint_ref
+    }
+}
+
+fn roster(worker: Option<usize>, candidates: Vec<usize>, worker_scores: Vec<i64>) -> Roster {
+    Roster {
+        shifts: vec![Shift { worker, candidates }],
+        worker_scores,
+        score: None,
+    }
+}
+
+fn create_director(solution: Roster) -> ScoreDirector<Roster, RosterScoreConstraint> {
+    let extractor = Box::new(EntityCollectionExtractor::new(
+        "Shift",
+        "shifts",
+        get_shifts,
+        get_shifts_mut,
+    ));
+    let entity_desc =
+        EntityDescriptor::new("Shift", TypeId::of::<Shift>(), "shifts").with_extractor(extractor);
+    let descriptor =
+        SolutionDescriptor::new("Roster", TypeId::of::<Roster>()).with_entity(entity_desc);
+    ScoreDirector::with_descriptor(
+        solution,
+        RosterScoreConstraint {
+            constraint_ref: ConstraintRef::new("", "rosterScore"),
+            current_score: SoftScore::ZERO,
+        },
+        descriptor,
+        |s, _| s.shifts.len(),
+    )
+}
+
+fn recreate_move(
+    value_source: ScalarRecreateValueSource<Roster>,
+    recreate_heuristic_type: RecreateHeuristicType,
+    allows_unassigned: bool,
+) -> RuinRecreateMove<Roster> {
+    RuinRecreateMove::new(
+        &[0],
+        get_worker,
+        set_worker,
+        0,
+        0,
+        "worker",
+        value_source,
+        recreate_heuristic_type,
+        allows_unassigned,
+    )
+}
+
+fn solution_count(limit: Option<usize>) -> ScalarRecreateValueSource<Roster> {
+    ScalarRecreateValueSource::SolutionCount {
+        count_fn: worker_count,
+        provider_index: 0,
+        value_candidate_limit: limit,
+    }
+}
+
+fn entity_slice(limit: Option<usize>) -> ScalarRecreateValueSource<Roster> {
+    ScalarRecreateValueSource::EntitySlice {
+        values_for_entity: shift_candidates,
+        variable_index: 0,
+        value_candidate_limit: limit,
+    }
+}
+
+fn candidate_slice(limit: Option<usize>) -> ScalarRecreateValueSource<Roster> {
+    ScalarRecreateValueSource::CandidateSlice {
+        candidate_values: shift_candidates,
+        variable_index: 0,
+        value_candidate_limit: limit,
+    }
+}
+
+#[test]
+fn empty_source_has_no_values() {
+    let solution = roster(None, vec![1, 2], vec![0; 4]);
+    let source = ScalarRecreateValueSource::<Roster>::Empty;
+
+    assert_eq!(source.value_count(&solution, 0), 0);
+    assert!(!source.has_values_for_entity(&solution, 0));
+}
+
+#[test]
+fn countable_range_walks_from_offset() {
+    let solution = roster(None, Vec::new(), Vec::new());
+    let source = ScalarRecreateValueSource::<Roster>::CountableRange { from: 3, to: 6 };
+    let inverted = ScalarRecreateValueSource::<Roster>::CountableRange { from: 6, to: 3 };
+
+    assert_eq!(source.values_for_entity(&solution, 0), vec![3, 4, 5]);
+    assert_eq!(inverted.value_count(&solution, 0), 0);
+}
+
+#[test]
+fn solution_count_walks_provider_indexes_up_to_limit() {
+    let solution = roster(None, Vec::new(), vec![0; 5]);
+
+    assert_eq!(
+        solution_count(None).values_for_entity(&solution, 0),
+        vec![0, 1, 2, 3, 4]
+    );
+    assert_eq!(
+        solution_count(Some(2)).values_for_entity(&solution, 0),
+        vec![0, 1]
+    );
+    assert_eq!(
+        solution_count(Some(9)).values_for_entity(&solution, 0),
+        vec![0, 1, 2, 3, 4]
+    );
+}
+
+#[test]
+fn slice_sources_walk_entity_values_up_to_limit() {
+    let solution = roster(None, vec![7, 4, 9], vec![0; 10]);
+
+    for source in [entity_slice(None), candidate_slice(None)] {
+        assert_eq!(source.values_for_entity(&solution, 0), vec![7, 4, 9]);
+    }
+    for source in [entity_slice(Some(2)), candidate_slice(Some(2))] {
+        assert_eq!(source.values_for_entity(&solution, 0), vec![7, 4]);
+    }
+}
+
+#[test]
+fn zero_candidate_limit_leaves_no_values() {
+    let solution = roster(None, vec![7, 4, 9], vec![0; 10]);
+
+    for source in [
+        solution_count(Some(0)),
+        entity_slice(Some(0)),
+        candidate_slice(Some(0)),
+    ] {
+        assert_eq!(source.value_count(&solution, 0), 0);
+        assert!(!source.has_values_for_entity(&solution, 0));
+    }
+}
+
+#[test]
+fn first_fit_takes_first_improving_candidate_in_slice_order() {
+    let mut director = create_director(roster(Some(1), vec![2, 0, 1], vec![3, 9, -4]));
+    let m = recreate_move(entity_slice(None), RecreateHeuristicType::FirstFit, true);
+
+    assert!(m.is_doable(&director));
+    m.do_move(&mut director);
+
+    assert_eq!(get_worker(director.working_solution(), 0, 0), Some(0));
+}
+
+#[test]
+fn cheapest_insertion_picks_best_candidate_within_limit() {
+    let mut director = create_director(roster(Some(2), vec![2, 0, 1], vec![3, 9, -4]));
+    let unlimited = recreate_move(
+        candidate_slice(None),
+        RecreateHeuristicType::CheapestInsertion,
+        true,
+    );
+    unlimited.do_move(&mut director);
+    assert_eq!(get_worker(director.working_solution(), 0, 0), Some(1));
+
+    let limited = recreate_move(
+        candidate_slice(Some(2)),
+        RecreateHeuristicType::CheapestInsertion,
+        true,
+    );
+    limited.do_move(&mut director);
+    assert_eq!(get_worker(director.working_solution(), 0, 0), Some(0));
+}
+
+#[test]
+fn cheapest_insertion_keeps_earliest_candidate_on_ties() {
+    let mut director = create_director(roster(Some(2), vec![1, 0, 2], vec![5, 5, 1]));
+    let m = recreate_move(
+        entity_slice(None),
+        RecreateHeuristicType::CheapestInsertion,
+        false,
+    );
+
+    m.do_move(&mut director);
+
+    assert_eq!(get_worker(director.working_solution(), 0, 0), Some(1));
+}
+
+#[test]
+fn cheapest_insertion_over_countable_range_skips_values_below_from() {
+    let mut director = create_director(roster(Some(1), Vec::new(), vec![9, 2, 4]));
+    let m = recreate_move(
+        ScalarRecreateValueSource::CountableRange { from: 1, to: 3 },
+        RecreateHeuristicType::CheapestInsertion,
+        false,
+    );
+
+    m.do_move(&mut director);
+
+    assert_eq!(get_worker(director.working_solution(), 0, 0), Some(2));
+}
+
+#[test]
+fn zero_candidate_limit_blocks_required_recreate() {
+    let director = create_director(roster(Some(0), vec![0, 1], vec![1, 2]));
+    let m = recreate_move(
+        solution_count(Some(0)),
+        RecreateHeuristicType::FirstFit,
+        false,
+    );
+
+    assert!(!m.is_doable(&director));
+}
@@ -135,6 +135,9 @@ impl<S: PlanningSolution> SolverRuntime<S> {
         best_score: S::Score,
         telemetry: SolverTelemetry,
     ) {
+        // Clone the retained snapshot before taking the publication lock so
+        // status readers never wait on a full solution copy.
+        let snapshot_solution = solution.clone();
         self.slot.with_publication(|sender, record| {
             let state = self.current_state();
             let terminal_reason = record.terminal_reason;
@@ -150,7 +153,7 @@ impl<S: PlanningSolution> SolverRuntime<S> {
                 current_score,
                 best_score: Some(best_score),
                 telemetry: record.telemetry.clone(),
-                solution: solution.clone(),
+                solution: snapshot_solution,
             });
 
             let metadata = record.next_metadata(self.job_id, state, Some(snapshot_revision));
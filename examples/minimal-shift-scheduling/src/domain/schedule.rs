@@ -1,4 +1,5 @@
 use solverforge::prelude::*;
+use solverforge::stream::joiner::equal;
 
 use super::{Nurse, Shift};
 
@@ -28,15 +29,8 @@ fn define_constraints() -> impl ConstraintSet<Schedule, HardSoftScore> {
 
     let one_shift_per_nurse_day = ConstraintFactory::<Schedule, HardSoftScore>::new()
         .for_each(Schedule::shifts())
-        .join((
-            ConstraintFactory::<Schedule, HardSoftScore>::new().for_each(Schedule::shifts()),
-            |left: &Shift, right: &Shift| {
-                left.id < right.id
-                    && left.day == right.day
-                    && left.nurse_idx.is_some()
-                    && left.nurse_idx == right.nurse_idx
-            },
-        ))
+        .filter(|shift: &Shift| shift.nurse_idx.is_some())
+        .join(equal(|shift: &Shift| (shift.day, shift.nurse_idx)))
         .penalize(HardSoftScore::ONE_HARD)
         .named("One shift per nurse day");
 
@@ -1,5 +1,5 @@
 use solverforge::prelude::*;
-use solverforge::stream::joiner::equal_bi;
+use solverforge::stream::joiner::{equal, equal_bi};
 use solverforge::stream::ConstraintFactory;
 
 use super::{Machine, MachineSequence, Operation};
@@ -48,16 +48,10 @@ fn define_constraints() -> impl ConstraintSet<JobShopPlan, HardSoftScore> {
 
     let same_job_same_machine = ConstraintFactory::<JobShopPlan, HardSoftScore>::new()
         .for_each(JobShopPlan::operations())
-        .join((
-            ConstraintFactory::<JobShopPlan, HardSoftScore>::new()
-                .for_each(JobShopPlan::operations()),
-            |left: &Operation, right: &Operation| {
-                left.id < right.id
-                    && left.job == right.job
-                    && left.machine_idx.is_some()
-                    && left.machine_idx == right.machine_idx
-            },
-        ))
+        .filter(|operation: &Operation| operation.machine_idx.is_some())
+        .join(equal(|operation: &Operation| {
+            (operation.job, operation.machine_idx)
+        }))
         .penalize(HardSoftScore::ONE_SOFT)
         .named("Same job machine reuse");
 
@@ -1,4 +1,5 @@
 use solverforge::prelude::*;
+use solverforge::stream::joiner::equal;
 use solverforge::stream::ConstraintFactory;
 
 use super::{Queen, Row};
@@ -25,23 +26,39 @@ fn define_constraints() -> impl ConstraintSet<Board, HardSoftScore> {
         .penalize(HardSoftScore::ONE_HARD)
         .named("Unassigned queen");
 
-    let conflict = ConstraintFactory::<Board, HardSoftScore>::new()
+    // Queens sit in distinct columns, so an attacking pair shares exactly one of
+    // the row, ascending-diagonal, or descending-diagonal keys below.
+    let row_conflict = ConstraintFactory::<Board, HardSoftScore>::new()
         .for_each(Board::queens())
-        .join((
-            ConstraintFactory::<Board, HardSoftScore>::new().for_each(Board::queens()),
-            |left: &Queen, right: &Queen| {
-                if left.column >= right.column {
-                    return false;
-                }
-                let (Some(left_row), Some(right_row)) = (left.row_idx, right.row_idx) else {
-                    return false;
-                };
-                left_row == right_row
-                    || left_row.abs_diff(right_row) == left.column.abs_diff(right.column)
-            },
-        ))
+        .filter(|queen: &Queen| queen.row_idx.is_some())
+        .join(equal(|queen: &Queen| queen.row_idx))
         .penalize(HardSoftScore::ONE_HARD)
-        .named("Queen conflict");
+        .named("Queen row conflict");
 
-    (unassigned, conflict)
+    let ascending_diagonal_conflict = ConstraintFactory::<Board, HardSoftScore>::new()
+        .for_each(Board::queens())
+        .filter(|queen: &Queen| queen.row_idx.is_some())
+        .join(equal(|queen: &Queen| {
+            queen.row_idx.map(|row| row + queen.column)
+        }))
+        .penalize(HardSoftScore::ONE_HARD)
+        .named("Queen ascending diagonal conflict");
+
+    let descending_diagonal_conflict = ConstraintFactory::<Board, HardSoftScore>::new()
+        .for_each(Board::queens())
+        .filter(|queen: &Queen| queen.row_idx.is_some())
+        .join(equal(|queen: &Queen| {
+            queen
+                .row_idx
+                .map(|row| row as isize - queen.column as isize)
+        }))
+        .penalize(HardSoftScore::ONE_HARD)
+        .named("Queen descending diagonal conflict");
+
+    (
+        unassigned,
+        row_conflict,
+        ascending_diagonal_conflict,
+        descending_diagonal_conflict,
+    )
 }